@@ -8,38 +8,62 @@ Exposes 4 endpoints that wrap Scrapling's 3 fetcher tiers + adaptive extraction:
   POST /extract  → Adaptive CSS/XPath extraction with element tracking
   GET  /health   → Health check
 
+Add ?stream=1 to /fetch, /dynamic or /stealth to get NDJSON instead: a
+"header" line with the ScrapeResponse fields except content, "content" lines
+carrying the page text (up to 16KB each) as the page tree is walked, and an
+"end" line with content_length.
+
 Usage:
   cd scripts/scrapling-service
   py -3.12 -m venv .venv
   .venv/Scripts/activate  (Windows) or source .venv/bin/activate (Linux/Mac)
   pip install -r requirements.txt
   scrapling install
-  uvicorn server:app --port 8099
+  python server.py  (uvloop + httptools; or: uvicorn server:app --port 8099 --loop uvloop --http httptools)
 
 The TypeScript agents call this service at http://localhost:8099.
+
+Environment:
+  SCRAPLING_POOL_SIZE   Default browser concurrency (default 4)
+  DYNAMIC_CONCURRENCY   Concurrent /dynamic fetches on the warm Chromium (default SCRAPLING_POOL_SIZE)
+  STEALTH_CONCURRENCY   Concurrent /stealth fetches on the warm stealth browser (default 2)
+  SCRAPLING_THREAD_POOL Worker threads for blocking fetches (default 64)
+  SCRAPLING_WARM_TIERS  Tiers to load at startup (default fetch,dynamic,stealth).
+                        Set to "fetch" on boxes that never launch a browser.
+  UVICORN_WORKERS       Worker processes for python server.py (default 1). Each
+                        worker runs its own warm browsers and thread pool.
 """
 
 import asyncio
+import importlib
+import inspect
+import logging
+import os
+import sys
+import threading
 import time
 import traceback
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, asynccontextmanager
+from functools import lru_cache
+from typing import Literal, Optional, get_args
+from urllib.parse import urlsplit
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from lxml import etree
+import orjson
 from pydantic import BaseModel, Field
 
-app = FastAPI(
-    title="Scrapling Service",
-    description="Stealth web scraping microservice for agency-board agents",
-    version="1.0.0",
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
-    allow_methods=["POST", "GET"],
-    allow_headers=["*"],
-)
+log = logging.getLogger("scrapling-service")
+# Own handler instead of basicConfig: a root handler would print every scrapling record a second time
+if not log.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    log.addHandler(_log_handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
 
 # ---------------------------------------------------------------------------
 # Blocked hosts — same list as browserless.ts for safety parity
@@ -56,22 +80,46 @@ BLOCKED_PREFIXES = (
 )
 
 
+# Built once at import so the checks below loop in C with no per-request allocation
+_BLOCKED_HOSTS_FROZEN = frozenset(BLOCKED_HOSTS)
+_BLOCKED_SUFFIXES = tuple(f".{h}" for h in BLOCKED_HOSTS)
+
+
+# Netloc characters urlsplit treats specially (IPv6 brackets, query/fragment
+# delimiters, stripped whitespace); any of these sends a URL down the slow path
+_NETLOC_SPECIAL = frozenset("[]\\?#\t\r\n")
+
+
+def _url_host(url: str) -> str:
+    """Lowercased hostname of url, same result as urlsplit(url).hostname."""
+    parts = url.split("/", 3)
+    scheme = parts[0][:-1]
+    if len(parts) >= 3 and parts[0].endswith(":") and not parts[1] and scheme.isascii() and scheme.isalnum():
+        netloc = parts[2]
+        if netloc.isascii() and _NETLOC_SPECIAL.isdisjoint(netloc):
+            return netloc.rpartition("@")[2].partition(":")[0].lower()
+    return (urlsplit(url).hostname or "").lower()
+
+
+@lru_cache(maxsize=4096)
+def _is_blocked_host(host: str) -> Optional[str]:
+    """Return reason string if host is blocked, else None. Agents hit the same hosts in bursts."""
+    if (
+        host in _BLOCKED_HOSTS_FROZEN
+        or host.startswith(BLOCKED_PREFIXES)
+        or host.endswith(_BLOCKED_SUFFIXES)
+    ):
+        return f"Blocked host: {host}"
+    return None
+
+
 def _is_blocked(url: str) -> Optional[str]:
     """Return reason string if URL is blocked, else None."""
-    from urllib.parse import urlparse
     try:
-        parsed = urlparse(url if url.startswith("http") else f"https://{url}")
+        host = _url_host(url if url.startswith("http") else f"https://{url}")
     except Exception:
         return "Invalid URL"
-    host = (parsed.hostname or "").lower()
-    if host in BLOCKED_HOSTS:
-        return f"Blocked host: {host}"
-    for prefix in BLOCKED_PREFIXES:
-        if host.startswith(prefix):
-            return f"Blocked host: {host}"
-    if any(host.endswith(f".{b}") for b in BLOCKED_HOSTS):
-        return f"Blocked host: {host}"
-    return None
+    return _is_blocked_host(host)
 
 
 # ---------------------------------------------------------------------------
@@ -88,12 +136,14 @@ class DynamicRequest(BaseModel):
     wait_selector: Optional[str] = Field(default=None, description="CSS selector to wait for before extracting")
     timeout: int = Field(default=30, description="Timeout in seconds")
     headless: bool = True
+    strategy: Literal["browser", "auto"] = Field(default="browser", description="browser: always render. auto: plain HTTP first, render only on a JS challenge or empty page")
 
 class StealthRequest(BaseModel):
     url: str
     timeout: int = Field(default=45, description="Timeout in seconds")
     headless: bool = True
     disable_resources: bool = Field(default=True, description="Disable loading images/fonts/etc for faster loading")
+    strategy: Literal["browser", "auto"] = Field(default="browser", description="browser: always render. auto: plain HTTP first, render only on a JS challenge or empty page")
 
 class ExtractRequest(BaseModel):
     url: str
@@ -101,6 +151,7 @@ class ExtractRequest(BaseModel):
     fetcher: str = Field(default="stealth", description="Which fetcher to use: fetch, dynamic, stealth")
     timeout: int = Field(default=30)
 
+# Response shapes, documented in OpenAPI; endpoints build the bodies directly
 class ScrapeResponse(BaseModel):
     success: bool
     url: str
@@ -121,66 +172,570 @@ class ExtractResponse(BaseModel):
     error: Optional[str] = None
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson, much faster than stdlib json on 50KB page bodies."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+STREAM_CHUNK = 16_384  # max characters of page text per NDJSON content line
+
+
+def _scrape_response(
+    success: bool, url: str, fetcher_used: str, duration_ms: int,
+    status: Optional[int] = None, title: Optional[str] = None,
+    content: Optional[str] = None, error: Optional[str] = None,
+    stream: bool = False,
+):
+    """ScrapeResponse-shaped body, serialized directly without a pydantic validation pass."""
+    header = {
+        "success": success, "url": url, "status": status, "title": title,
+        "error": error, "fetcher_used": fetcher_used, "duration_ms": duration_ms,
+    }
+    if stream:
+        return _stream_scrape(header, (content,) if content else ())
+    return ORJSONResponse({**header, "content": content, "content_length": len(content) if content else 0})
+
+
+def _stream_scrape(header: dict, pieces) -> StreamingResponse:
+    """Send a scrape result as NDJSON: a header line, the text pieces batched
+    into content lines as they are produced, then an end line."""
+
+    async def lines():
+        yield orjson.dumps({"part": "header", **header}) + b"\n"
+        total = 0
+        batch: list[str] = []
+        size = 0
+        for piece in pieces:
+            batch.append(piece)
+            size += len(piece)
+            if size >= STREAM_CHUNK:
+                yield orjson.dumps({"part": "content", "data": "".join(batch)}) + b"\n"
+                total += size
+                batch, size = [], 0
+        if batch:
+            yield orjson.dumps({"part": "content", "data": "".join(batch)}) + b"\n"
+            total += size
+        yield orjson.dumps({"part": "end", "content_length": total}) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _extract_response(
+    success: bool, url: str, results: dict, fetcher_used: str,
+    duration_ms: int, error: Optional[str] = None,
+) -> ORJSONResponse:
+    """ExtractResponse-shaped body, serialized directly without a pydantic validation pass."""
+    return ORJSONResponse({
+        "success": success, "url": url, "results": results,
+        "fetcher_used": fetcher_used, "duration_ms": duration_ms, "error": error,
+    })
+
+
 # ---------------------------------------------------------------------------
-# Lazy-loaded fetchers (heavy imports, only load when first called)
+# Lazy-loaded fetchers (heavy imports, only load the tiers actually used)
 # ---------------------------------------------------------------------------
-_fetcher_cls = None
-_dynamic_cls = None
-_stealthy_cls = None
+_TIER_CLASSES = {
+    "fetch": "Fetcher",
+    "dynamic": "DynamicFetcher",
+    "stealth": "StealthyFetcher",
+}
+_TIER_SESSIONS = {
+    "dynamic": "AsyncDynamicSession",
+    "stealth": "AsyncStealthySession",
+}
+_fetcher_classes: dict = {}
+
+
+def _get(tier: str):
+    """Return the scrapling fetcher class for a tier, importing only that tier on first use."""
+    cls = _fetcher_classes.get(tier)
+    if cls is None:
+        # scrapling.fetchers resolves each class lazily, so a deployment that
+        # only serves /fetch never loads the browser fetcher modules
+        cls = getattr(importlib.import_module("scrapling.fetchers"), _TIER_CLASSES[tier])
+        _fetcher_classes[tier] = cls
+    return cls
+
+
+# ---------------------------------------------------------------------------
+# Persistent HTTP sessions — one keep-alive curl session per impersonated
+# browser, so repeat requests to a host skip the TCP + TLS handshake
+# ---------------------------------------------------------------------------
+THREAD_POOL_SIZE = int(os.getenv("SCRAPLING_THREAD_POOL", "64"))  # workers for blocking curl calls
+
+_fetcher_sessions: dict = {}
+_fetcher_sessions_lock = threading.Lock()
+_fetcher_stack = ExitStack()
+
+
+@lru_cache(maxsize=1)
+def _impersonate_targets() -> frozenset:
+    """Fingerprints curl_cffi can impersonate; imported on first use like the fetchers."""
+    from curl_cffi.requests.impersonate import BrowserTypeLiteral
+    return frozenset(get_args(BrowserTypeLiteral))
+
+
+def _get_fetcher_session(impersonate: str):
+    """Return the shared FetcherSession for a browser fingerprint, opening it on first use.
+
+    Sessions are never evicted, so callers must pass a value from _impersonate_targets().
+    """
+    session = _fetcher_sessions.get(impersonate)
+    if session is None:
+        with _fetcher_sessions_lock:
+            session = _fetcher_sessions.get(impersonate)
+            if session is None:
+                from scrapling.fetchers import FetcherSession
+                session = _fetcher_stack.enter_context(FetcherSession(impersonate=impersonate))
+                _fetcher_sessions[impersonate] = session
+    return session
+
+
+def _http_get(url: str, impersonate: str = "chrome", **kwargs):
+    """GET url on the shared session for a fingerprint (blocking).
+
+    The connection is reused but cookies are not: curl starts every transfer
+    with an empty cookie engine and discard_cookies keeps the session jar
+    empty, so no scrape sends cookies set by an earlier one.
+    """
+    return _get_fetcher_session(impersonate).get(url, discard_cookies=True, **kwargs)
+
+
+def _close_fetcher_sessions():
+    """Close every persistent HTTP session."""
+    with _fetcher_sessions_lock:
+        _fetcher_sessions.clear()
+        _fetcher_stack.close()
+
+
+# ---------------------------------------------------------------------------
+# Playwright stack capture — older Playwright releases call inspect.stack() on
+# every API call, which resolves the source file of every frame on the stack
+# ---------------------------------------------------------------------------
+class _FastInspect:
+    """Stand-in for the inspect module inside Playwright's connection layer."""
+
+    def __getattr__(self, name):
+        return getattr(inspect, name)
+
+    @staticmethod
+    def stack(context: int = 1) -> list:
+        """Same frames as inspect.stack(), without the source lookups."""
+        frames = []
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            frames.append(inspect.FrameInfo(frame, code.co_filename, frame.f_lineno, code.co_name, None, None))
+            frame = frame.f_back
+        return frames
+
+
+def _patch_playwright_stack():
+    """Swap in a cheap inspect.stack() for Playwright builds that still use it."""
+    for name in ("playwright._impl._connection", "patchright._impl._connection"):
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        # Newer releases walk the frames themselves in _capture_stack_trace
+        if hasattr(module, "_capture_stack_trace") or getattr(module, "inspect", None) is not inspect:
+            continue
+        module.inspect = _FastInspect()
+        log.info(f"Patched inspect.stack() in {name}")
+
+
+# ---------------------------------------------------------------------------
+# Per-fetch browser contexts — scrapling sessions keep one persistent profile,
+# so cookies, storage and cache would carry from one agent's scrape to the next
+# ---------------------------------------------------------------------------
+class _ContextPerFetch:
+    """Session mixin: share one launched browser, open a fresh context for every fetch.
+
+    This is the layout scrapling already uses when rotating proxies, applied
+    without a proxy. A new context is a few ms; a browser launch is seconds.
+    """
+
+    async def start(self) -> None:
+        """Launch the shared browser, with no persistent profile."""
+        # Same Playwright flavour as the wrapped session (patchright for stealth)
+        async_playwright = sys.modules[super().start.__module__].async_playwright
+        self.playwright = await async_playwright().start()
+        try:
+            self.browser = await self.playwright.chromium.launch(**self._browser_options)
+        except Exception:
+            await self.playwright.stop()
+            self.playwright = None
+            raise
+        self._is_alive = True
+
+    @asynccontextmanager
+    async def _page_generator(self, timeout, extra_headers, disable_resources, proxy=None, blocked_domains=None):
+        """Open a tab in a context of its own and close the whole context afterwards."""
+        context = await self.browser.new_context(**self._build_context_with_proxy(proxy))
+        page_info = None
+        try:
+            context = await self._initialize_context(self._config, context)
+            page_info = await self._get_page(timeout, extra_headers, disable_resources, blocked_domains, context=context)
+            yield page_info
+        finally:
+            if page_info is not None:
+                self.page_pool.remove_page(page_info)
+            await context.close()
+
+
+_isolated_session_classes: dict = {}
+
+
+def _isolated_session_class(tier: str):
+    """scrapling's async session class for a browser tier, with _ContextPerFetch mixed in."""
+    cls = _isolated_session_classes.get(tier)
+    if cls is None:
+        base = getattr(importlib.import_module("scrapling.fetchers"), _TIER_SESSIONS[tier])
+        cls = _isolated_session_classes[tier] = type(f"Isolated{base.__name__}", (_ContextPerFetch, base), {})
+    return cls
+
+
+# ---------------------------------------------------------------------------
+# Warm browser sessions (launched once at startup, reused across requests)
+# ---------------------------------------------------------------------------
+POOL_SIZE = int(os.getenv("SCRAPLING_POOL_SIZE", "4"))
+# Concurrent fetches per browser tier, each in its own context on the warm browser
+TIER_CONCURRENCY = {
+    "dynamic": int(os.getenv("DYNAMIC_CONCURRENCY", str(POOL_SIZE))),
+    "stealth": int(os.getenv("STEALTH_CONCURRENCY", "2")),
+}
+_tier_limits = {tier: asyncio.Semaphore(n) for tier, n in TIER_CONCURRENCY.items()}
+WARM_TIERS = frozenset(
+    t.strip() for t in os.getenv("SCRAPLING_WARM_TIERS", "fetch,dynamic,stealth").split(",") if t.strip()
+) & _TIER_CLASSES.keys()
+
+_warm_sessions: dict = {}
+_warm_task: Optional[asyncio.Task] = None  # scrapling imports
+_warm_tier_tasks: dict[str, asyncio.Task] = {}  # browser launches, one per tier
 
 
-def _get_fetcher():
-    global _fetcher_cls
-    if _fetcher_cls is None:
-        from scrapling import Fetcher
-        _fetcher_cls = Fetcher
-    return _fetcher_cls
+def _load_warm_tiers():
+    """Import the warmed fetcher tiers up front (slow, synchronous)."""
+    for tier in WARM_TIERS:
+        _get(tier)
+    if "fetch" in WARM_TIERS:
+        _get_fetcher_session("chrome")
+    if WARM_TIERS & _TIER_SESSIONS.keys():
+        _patch_playwright_stack()
 
 
-def _get_dynamic():
-    global _dynamic_cls
-    if _dynamic_cls is None:
-        from scrapling import DynamicFetcher
-        _dynamic_cls = DynamicFetcher
-    return _dynamic_cls
+async def _warm() -> bool:
+    """Import the warmed fetcher tiers. Returns False if scrapling could not be loaded."""
+    try:
+        # Keep the slow scrapling imports off the event loop
+        await asyncio.to_thread(_load_warm_tiers)
+    except Exception as e:
+        log.warning(f"Could not import scrapling fetchers: {e}")
+        return False
+    return True
+
+
+async def _warm_tier(tier: str, imports: asyncio.Task):
+    """Launch the persistent headless browser for one tier once the imports are done."""
+    if not await asyncio.shield(imports):
+        return
+    try:
+        session = _isolated_session_class(tier)(headless=True, max_pages=TIER_CONCURRENCY[tier])
+        await session.start()
+        _warm_sessions[tier] = session
+        log.info(f"Warm {tier} browser ready ({TIER_CONCURRENCY[tier]} contexts)")
+    except Exception as e:
+        log.warning(f"Could not warm {tier} browser, using per-request launch: {e}")
 
 
-def _get_stealthy():
-    global _stealthy_cls
-    if _stealthy_cls is None:
-        from scrapling import StealthyFetcher
-        _stealthy_cls = StealthyFetcher
-    return _stealthy_cls
+def _start_warm():
+    """Schedule the imports and launch every warmed browser tier concurrently."""
+    global _warm_task
+    _warm_task = asyncio.create_task(_warm())
+    for tier in _TIER_SESSIONS.keys() & WARM_TIERS:
+        _warm_tier_tasks[tier] = asyncio.create_task(_warm_tier(tier, _warm_task))
+
+
+async def _wait_warm():
+    """Wait for every warm-up task, so no launch is cut off halfway."""
+    tasks = [_warm_task, *_warm_tier_tasks.values()] if _warm_task is not None else []
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _close_warm():
+    """Close every warm browser session."""
+    for tier, session in list(_warm_sessions.items()):
+        try:
+            await session.close()
+        except Exception:
+            pass
+        _warm_sessions.pop(tier, None)
+
+
+async def _relaunch_warm(tier: str, dead):
+    """Tear down a warm browser that crashed and launch a replacement."""
+    try:
+        await dead.close()
+    except Exception:
+        pass
+    if dead.playwright is not None:
+        # close() stops at the dead browser, the driver still has to go
+        try:
+            await dead.playwright.stop()
+        except Exception:
+            pass
+    await _warm_tier(tier, _warm_task)
+
+
+async def _run_on_warm_context(tier: str, url: str, **kwargs):
+    """Fetch url on the warm browser for a tier. Returns None if no warm browser is available."""
+    task = _warm_tier_tasks.get(tier)
+    if task is not None and not task.done():
+        # Requests that arrive during boot (or a relaunch) wait for their tier's warm-up instead of launching their own browser
+        await asyncio.shield(task)
+    session = _warm_sessions.get(tier)
+    if session is None:
+        return None
+    if session.browser.is_connected():
+        try:
+            return await session.fetch(url, **kwargs)
+        except Exception:
+            if session.browser.is_connected():
+                raise  # the page failed, the browser is fine
+    # Crashed or OOM-killed: swap in a new browser, and serve this request with a per-request launch
+    if _warm_sessions.get(tier) is session:
+        log.warning(f"Warm {tier} browser died, relaunching it")
+        del _warm_sessions[tier]
+        _warm_tier_tasks[tier] = asyncio.create_task(_relaunch_warm(tier, session))
+    return None
+
+
+async def _browser_fetch(tier: str, url: str, headless: bool = True, **kwargs):
+    """Fetch url with a browser tier, admitting at most TIER_CONCURRENCY[tier] at once."""
+    async with _tier_limits[tier]:
+        page = await _run_on_warm_context(tier, url, **kwargs) if headless else None
+        if page is None:
+            # Run sync Playwright call in a thread to avoid asyncio conflict
+            page = await asyncio.to_thread(_get(tier).fetch, url, headless=headless, **kwargs)
+    return page
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+def _stopwatch():
+    """Start a monotonic timer. The returned callable gives whole milliseconds elapsed."""
+    start = time.perf_counter_ns()
+    return lambda: (time.perf_counter_ns() - start) // 1_000_000
+
+
 MAX_CONTENT = 50_000  # 50KB cap on returned content
+IGNORE_TAGS = frozenset({"script", "style", "nav", "footer", "header"})
+MAX_TITLE = 500
+# Same elements page.css("title") matches, compiled once instead of per request
+_TITLE_XPATH = etree.XPath("descendant-or-self::title")
+
+
+def _iter_visible_text(root):
+    """Yield the visible text under root in document order, newline-joined like
+    scrapling's get_all_text() and capped at MAX_CONTENT characters.
+
+    The tree is walked lazily, so a 1MB page is never fully concatenated just to
+    be sliced down to 50KB, and a streamed response can send text as it is found.
+    """
+    remaining = MAX_CONTENT
+    sep = ""
+    skip = 0  # depth inside ignored tags
+    for event, el in etree.iterwalk(root, events=("start", "end")):
+        if event == "start":
+            if el.tag in IGNORE_TAGS:
+                skip += 1
+            # Comments and processing instructions have no visible text, only their tails count
+            text = el.text if isinstance(el.tag, str) else None
+        else:
+            if el.tag in IGNORE_TAGS:
+                skip -= 1
+            text = el.tail if el is not root else None
+        if skip or not text or not text.strip():
+            continue
+        piece = sep + text
+        if len(piece) >= remaining:
+            yield piece[:remaining]
+            return
+        yield piece
+        remaining -= len(piece)
+        sep = "\n"
+
+
+def _fallback_text(page) -> str:
+    """Page text for responses without an lxml tree."""
+    try:
+        text = page.get_all_text(ignore_tags=tuple(IGNORE_TAGS))
+    except Exception:
+        try:
+            text = page.body.text if page.body else ""
+        except Exception:
+            text = str(page.text) if hasattr(page, "text") else ""
+    return text[:MAX_CONTENT]
 
 
-def _extract_page_info(page) -> tuple[str, str, int]:
-    """Extract title, text content, and status from a scrapling page response."""
-    title = ""
+def _page_text(page):
+    """Yield the page's visible text in pieces, MAX_CONTENT characters at most."""
+    root = getattr(page, "_root", None)
+    if root is not None:
+        yield from _iter_visible_text(root)
+    else:
+        yield _fallback_text(page)
+
+
+def _page_title(page) -> str:
+    """The page's <title>, trimmed to MAX_TITLE."""
     try:
-        title_el = page.css("title")
+        root = getattr(page, "_root", None)
+        title_el = _TITLE_XPATH(root) if root is not None else page.css("title")
         if title_el:
-            title = title_el[0].text or ""
+            return (title_el[0].text or "")[:MAX_TITLE].strip()
     except Exception:
         pass
+    return ""
+
+
+def _page_status(page) -> int:
+    return getattr(page, "status", None) or 200
 
-    text = ""
+
+def _extract_page_info(page) -> tuple[str, str, int]:
+    """Extract title, text content, and status from a scrapling page response."""
     try:
-        text = page.get_all_text(ignore_tags=("script", "style", "nav", "footer", "header"))
+        text = "".join(_page_text(page))
     except Exception:
+        text = _fallback_text(page)
+    return _page_title(page), text, _page_status(page)
+
+
+def _page_response(url: str, fetcher_used: str, elapsed_ms, page, stream: bool = False):
+    """Scrape response for a fetched page. Streamed responses walk the page text
+    as the content lines are sent instead of building it up front."""
+    if stream:
+        header = {
+            "success": True, "url": url, "status": _page_status(page), "title": _page_title(page),
+            "error": None, "fetcher_used": fetcher_used, "duration_ms": elapsed_ms(),
+        }
+        return _stream_scrape(header, _page_text(page))
+    title, text, status = _extract_page_info(page)
+    return _scrape_response(True, url, fetcher_used, elapsed_ms(), status=status, title=title, content=text)
+
+
+MAX_EXTRACT_RESULTS = 50  # per selector
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> etree.XPath:
+    """Compile a CSS selector (scrapling dialect, incl. ::text / ::attr()) into a reusable XPath."""
+    from scrapling.core.translator import css_to_xpath
+    return etree.XPath(css_to_xpath(selector))
+
+
+def _select(page, selector: str) -> list[str]:
+    """Run one selector straight against the page's lxml tree, skipping scrapling's element wrappers."""
+    root = getattr(page, "_root", None)
+    if root is None:
+        return [
+            (el.text or el.attrib.get("href", "") or el.attrib.get("src", "") or "")
+            for el in page.css(selector)[:MAX_EXTRACT_RESULTS]
+        ]
+    return [
+        # ::text and ::attr() selectors yield strings rather than elements
+        str(node) if isinstance(node, str) else (node.text or node.get("href") or node.get("src") or "")
+        for node in _compile_selector(selector)(root)[:MAX_EXTRACT_RESULTS]
+    ]
+
+
+# ---------------------------------------------------------------------------
+# strategy=auto — most pages don't need a browser, so try the plain HTTP tier
+# first and only escalate when the result looks like a challenge or a shell
+# ---------------------------------------------------------------------------
+AUTO_HTTP_TIMEOUT = 10  # seconds, and never more than a third of the request timeout
+AUTO_MIN_BROWSER_MS = 1000  # floor for what is left of the budget; Playwright reads 0 as no timeout
+AUTO_MIN_TEXT = 500  # same bar the TS tiered fetch uses to accept a result
+CHALLENGE_STATUSES = frozenset({403, 429, 503})
+CHALLENGE_MARKERS = ("_cf_chl_opt", "/cdn-cgi/challenge-platform/", "challenges.cloudflare.com")
+_CHALLENGE_MARKERS_BYTES = tuple(m.encode() for m in CHALLENGE_MARKERS)
+
+
+def _needs_browser(page, wait_selector: Optional[str] = None) -> bool:
+    """True if a plain HTTP result is a JS challenge, a page that only renders client-side,
+    or is missing the element the caller asked to wait for."""
+    if getattr(page, "status", None) in CHALLENGE_STATUSES:
+        return True
+    text_len = 0
+    for piece in _page_text(page):
+        text_len += len(piece)
+        if text_len >= AUTO_MIN_TEXT:
+            break
+    else:
+        return True
+    if wait_selector and not page.css(wait_selector):
+        return True
+    body = getattr(page, "body", None) or ""
+    markers = _CHALLENGE_MARKERS_BYTES if isinstance(body, bytes) else CHALLENGE_MARKERS
+    return any(m in body for m in markers)
+
+
+async def _scrape(tier: str, url: str, strategy: str, headless: bool = True, **kwargs) -> tuple:
+    """Fetch url for a browser tier, returning (page, fetcher_used).
+
+    kwargs["timeout"] is the browser timeout in milliseconds; with strategy="auto"
+    the plain HTTP attempt is taken out of it, so an escalated request still fits
+    the caller's budget.
+    """
+    if strategy == "auto":
+        elapsed_ms = _stopwatch()
         try:
-            text = page.body.text if page.body else ""
+            http_timeout = min(AUTO_HTTP_TIMEOUT, kwargs["timeout"] / 3000)
+            page = await asyncio.to_thread(_http_get, url, timeout=http_timeout, retries=1)
+            if not _needs_browser(page, kwargs.get("wait_selector")):
+                return page, "fetch"
         except Exception:
-            text = str(page.text) if hasattr(page, "text") else ""
+            pass  # fall through to the browser
+        # elapsed_ms includes waiting for a free worker thread, so under load it can eat the whole budget
+        kwargs["timeout"] = max(kwargs["timeout"] - elapsed_ms(), AUTO_MIN_BROWSER_MS)
+    page = await _browser_fetch(tier, url, headless=headless, **kwargs)
+    return page, tier
+
+
+# ---------------------------------------------------------------------------
+# FastAPI app
+# ---------------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm fetchers in the background on startup, close browsers on shutdown."""
+    # Blocking curl_cffi requests and sync browser fallbacks run on this pool via asyncio.to_thread
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE))
+    _start_warm()
+    yield
+    # Let in-flight launches finish so their driver processes are closed, not orphaned
+    await _wait_warm()
+    await _close_warm()
+    _close_fetcher_sessions()
 
-    text = text[:MAX_CONTENT]
-    status = getattr(page, "status", None) or 200
-    return title, text, status
+
+app = FastAPI(
+    title="Scrapling Service",
+    description="Stealth web scraping microservice for agency-board agents",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
+    allow_methods=["POST", "GET"],
+    allow_headers=["*"],
+)
 
 
 # ---------------------------------------------------------------------------
@@ -188,153 +743,111 @@ def _extract_page_info(page) -> tuple[str, str, int]:
 # ---------------------------------------------------------------------------
 @app.get("/health")
 async def health():
-    return {"status": "ok", "service": "scrapling", "version": "1.0.0"}
+    return {
+        "status": "ok",
+        "service": "scrapling",
+        "version": "1.0.0",
+        "warm": sorted(_warm_sessions),
+    }
 
 
-@app.post("/fetch", response_model=ScrapeResponse)
-async def fetch_endpoint(req: FetchRequest):
+@app.post("/fetch", responses={200: {"model": ScrapeResponse}})
+async def fetch_endpoint(req: FetchRequest, stream: bool = False):
     """Fast HTTP fetch with TLS fingerprint impersonation. No browser needed."""
     blocked = _is_blocked(req.url)
     if blocked:
         raise HTTPException(status_code=403, detail=blocked)
+    if req.impersonate not in _impersonate_targets():
+        raise HTTPException(status_code=422, detail=f"Unsupported impersonate target: {req.impersonate}")
 
-    start = time.time()
+    elapsed_ms = _stopwatch()
     try:
-        Fetcher = _get_fetcher()
-        page = Fetcher.get(
-            req.url,
-            impersonate=req.impersonate,
-            timeout=req.timeout,
-            headers=req.headers,
-        )
-        title, text, status = _extract_page_info(page)
-        dur = int((time.time() - start) * 1000)
-        return ScrapeResponse(
-            success=True, url=req.url, status=status,
-            title=title, content=text, fetcher_used="fetch",
-            duration_ms=dur, content_length=len(text),
-        )
+        # curl_cffi blocks on the socket, keep it off the event loop
+        page = await asyncio.to_thread(_http_get, req.url, req.impersonate, timeout=req.timeout, headers=req.headers)
+        return _page_response(req.url, "fetch", elapsed_ms, page, stream)
     except Exception as e:
-        dur = int((time.time() - start) * 1000)
-        return ScrapeResponse(
-            success=False, url=req.url, error=str(e),
-            fetcher_used="fetch", duration_ms=dur,
-        )
+        dur = elapsed_ms()
+        return _scrape_response(False, req.url, "fetch", dur, error=str(e), stream=stream)
 
 
-@app.post("/dynamic", response_model=ScrapeResponse)
-async def dynamic_endpoint(req: DynamicRequest):
+@app.post("/dynamic", responses={200: {"model": ScrapeResponse}})
+async def dynamic_endpoint(req: DynamicRequest, stream: bool = False):
     """Full Chromium browser for JS-rendered pages."""
     blocked = _is_blocked(req.url)
     if blocked:
         raise HTTPException(status_code=403, detail=blocked)
 
-    start = time.time()
+    elapsed_ms = _stopwatch()
     try:
-        Dynamic = _get_dynamic()
-        kwargs = {
-            "headless": req.headless,
-            "timeout": req.timeout * 1000,
-        }
+        kwargs = {"timeout": req.timeout * 1000}
         if req.wait_selector:
             kwargs["wait_selector"] = req.wait_selector
 
-        # Run sync Playwright call in a thread to avoid asyncio conflict
-        page = await asyncio.to_thread(Dynamic.fetch, req.url, **kwargs)
-        title, text, status = _extract_page_info(page)
-        dur = int((time.time() - start) * 1000)
-        return ScrapeResponse(
-            success=True, url=req.url, status=status,
-            title=title, content=text, fetcher_used="dynamic",
-            duration_ms=dur, content_length=len(text),
-        )
+        page, used = await _scrape("dynamic", req.url, req.strategy, headless=req.headless, **kwargs)
+        return _page_response(req.url, used, elapsed_ms, page, stream)
     except Exception as e:
-        dur = int((time.time() - start) * 1000)
-        return ScrapeResponse(
-            success=False, url=req.url, error=str(e),
-            fetcher_used="dynamic", duration_ms=dur,
-        )
+        dur = elapsed_ms()
+        return _scrape_response(False, req.url, "dynamic", dur, error=str(e), stream=stream)
 
 
-@app.post("/stealth", response_model=ScrapeResponse)
-async def stealth_endpoint(req: StealthRequest):
+@app.post("/stealth", responses={200: {"model": ScrapeResponse}})
+async def stealth_endpoint(req: StealthRequest, stream: bool = False):
     """Maximum anti-bot evasion via Camoufox (modified Firefox)."""
     blocked = _is_blocked(req.url)
     if blocked:
         raise HTTPException(status_code=403, detail=blocked)
 
-    start = time.time()
+    elapsed_ms = _stopwatch()
     try:
-        Stealthy = _get_stealthy()
-
-        def _run_stealthy():
-            return Stealthy.fetch(
-                req.url,
-                headless=req.headless,
-                timeout=req.timeout * 1000,
-                disable_resources=req.disable_resources,
-            )
-
-        # Run sync Playwright/Camoufox call in a thread to avoid asyncio conflict
-        page = await asyncio.to_thread(_run_stealthy)
-        title, text, status = _extract_page_info(page)
-        dur = int((time.time() - start) * 1000)
-        return ScrapeResponse(
-            success=True, url=req.url, status=status,
-            title=title, content=text, fetcher_used="stealth",
-            duration_ms=dur, content_length=len(text),
-        )
+        kwargs = {
+            "timeout": req.timeout * 1000,
+            "disable_resources": req.disable_resources,
+        }
+
+        page, used = await _scrape("stealth", req.url, req.strategy, headless=req.headless, **kwargs)
+        return _page_response(req.url, used, elapsed_ms, page, stream)
     except Exception as e:
-        dur = int((time.time() - start) * 1000)
-        return ScrapeResponse(
-            success=False, url=req.url, error=str(e),
-            fetcher_used="stealth", duration_ms=dur,
-        )
+        dur = elapsed_ms()
+        return _scrape_response(False, req.url, "stealth", dur, error=str(e), stream=stream)
 
 
-@app.post("/extract", response_model=ExtractResponse)
+@app.post("/extract", responses={200: {"model": ExtractResponse}})
 async def extract_endpoint(req: ExtractRequest):
     """Adaptive CSS selector extraction using any fetcher tier."""
     blocked = _is_blocked(req.url)
     if blocked:
         raise HTTPException(status_code=403, detail=blocked)
 
-    start = time.time()
+    elapsed_ms = _stopwatch()
     try:
         if req.fetcher == "fetch":
-            cls = _get_fetcher()
-            page = cls.get(req.url, impersonate="chrome", timeout=req.timeout)
-        elif req.fetcher == "dynamic":
-            cls = _get_dynamic()
-            page = await asyncio.to_thread(cls.fetch, req.url, headless=True, timeout=req.timeout * 1000)
+            page = await asyncio.to_thread(_http_get, req.url, timeout=req.timeout)
         else:
-            cls = _get_stealthy()
-            page = await asyncio.to_thread(cls.fetch, req.url, headless=True, timeout=req.timeout * 1000)
+            tier = "dynamic" if req.fetcher == "dynamic" else "stealth"
+            page = await _browser_fetch(tier, req.url, timeout=req.timeout * 1000)
 
         results: dict[str, list[str]] = {}
         for sel in req.selectors:
             try:
-                elements = page.css(sel)
-                results[sel] = [
-                    (el.text or el.attrib.get("href", "") or el.attrib.get("src", "") or "")
-                    for el in elements[:50]
-                ]
+                results[sel] = _select(page, sel)
             except Exception:
                 results[sel] = []
 
-        dur = int((time.time() - start) * 1000)
-        return ExtractResponse(
-            success=True, url=req.url, results=results,
-            fetcher_used=req.fetcher, duration_ms=dur,
-        )
+        dur = elapsed_ms()
+        return _extract_response(True, req.url, results, req.fetcher, dur)
     except Exception as e:
-        dur = int((time.time() - start) * 1000)
-        return ExtractResponse(
-            success=False, url=req.url, results={},
-            fetcher_used=req.fetcher, duration_ms=dur, error=str(e),
-        )
+        dur = elapsed_ms()
+        return _extract_response(False, req.url, {}, req.fetcher, dur, error=str(e))
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8099)
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8099,
+        # uvloop has no Windows build, local dev there runs on the stdlib loop
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("UVICORN_WORKERS", "1")),
+    )
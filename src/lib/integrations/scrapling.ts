@@ -33,6 +33,7 @@ export interface ScraplingDynamicOptions {
   waitSelector?: string;
   timeout?: number;
   headless?: boolean;
+  strategy?: 'browser' | 'auto';  // auto: plain HTTP first, browser only if needed
 }
 
 export interface ScraplingStealthOptions {
@@ -40,6 +41,7 @@ export interface ScraplingStealthOptions {
   timeout?: number;
   headless?: boolean;
   blockImages?: boolean;
+  strategy?: 'browser' | 'auto';
 }
 
 export interface ScraplingExtractOptions {
@@ -121,6 +123,7 @@ export async function scraplingDynamic(options: ScraplingDynamicOptions): Promis
     wait_selector: options.waitSelector,
     timeout: options.timeout || DEFAULT_TIMEOUT,
     headless: options.headless ?? true,
+    strategy: options.strategy,
   });
 }
 
@@ -136,6 +139,7 @@ export async function scraplingStealthy(options: ScraplingStealthOptions): Promi
     timeout: options.timeout || 45,
     headless: options.headless ?? true,
     disable_resources: options.blockImages ?? true,
+    strategy: options.strategy,
   });
 }
 